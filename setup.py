@@ -47,10 +47,20 @@ setup(
     python_requires=">=3.9",
     install_requires=[
         "beautifulsoup4>=4.12.0",
+        "lxml>=4.9.0",
+        "numpy>=1.21.0",
         "pandas>=1.5.0",
-        "requests>=2.28.0"
+        "requests>=2.30.0",
+        "urllib3>=2.0.0"
     ],
     extras_require={
+        "parquet": [
+            "pyarrow>=10.0.0",
+        ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "brotli>=1.0.9",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -1,16 +1,42 @@
 import datetime
+import hashlib
 import json
-import random
+import os
 import re
+import socket
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from logging import getLogger, StreamHandler, INFO
-from typing import Optional, Dict, Union, List
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Optional, Dict, Union, List, Iterator, Iterable
 
+import numpy as np
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 from requests.adapters import HTTPAdapter, Retry
+from requests.utils import get_encoding_from_headers
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up, the json module is used instead
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # Degrade to the pure-Python parser if lxml could not be installed
+    HTML_PARSER = 'html.parser'
+
+# Looked up once instead of on every parse. The class (not an instance) is shared:
+# BeautifulSoup instantiates it per parse, so concurrent parses never share parser state.
+_HTML_BUILDER = builder_registry.lookup(HTML_PARSER)
 
 
 def _get_logger(name: str = __name__):
@@ -50,6 +76,45 @@ EXCLUDE_PATTERNS = ['signin', 'login', 'subscri', 'member', 'footer', 'about', '
                     '/policy/copyright-policy', '/policy/data-policy', 'market-data/quotes/', 'buyside','livecoverage/stock'
                     'accessibility-statement', 'press-room', 'mansionglobal', 'images', 'mailto', 'youtube', '#']
 
+# Fields of the article dictionaries, in the column order used for Parquet output
+ARTICLE_FIELDS = ['url', 'timestamp', 'headline', 'content', 'summary', 'keywords', 'companies', 'date',
+                  'archive_url', 'article_type']
+
+# Prefix of the on-disk cache entries, followed by the response's Content-Type and a blank line
+# (omitted when the response had no Content-Type)
+_CACHE_HEADER = b'Content-Type: '
+
+# Wayback captures never change, so cached copies only expire to bound the cache size:
+# older entries are deleted by _prune_cache at the start of every download
+WAYBACK_CACHE_EXPIRE = 30 * 24 * 3600
+# The CDX index keeps growing as new captures are archived, so cached queries expire daily
+CDX_CACHE_EXPIRE = 24 * 3600
+
+# Last '-'-separated segment of a URL containing at least 4 digits, i.e. an article ID
+_ARTICLE_ID_RE = re.compile(r'-(?:[^-\d]*\d){4}[^-]*$')
+
+# First href attribute value of the anchors in a raw HTML page: double-quoted, single-quoted
+# or unquoted. The attributes before it are matched one by one, so that quoted values may
+# contain '>' and an unclosed tag is only scanned up to the next '<'
+_HREF_RE = re.compile(rb'<a(?:[\s/]+(?!href\s*=)[^\s/"\'<>=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'<>]+))?)*'
+                      rb'[\s/]+href\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))', re.IGNORECASE)
+
+# Comments, declarations and elements whose contents the HTML parser never turns into anchors.
+# Like the parser, an unclosed one runs to the end of the page, which also keeps the scan linear
+_NON_MARKUP_RE = re.compile(rb'<!--(?:-?>|.*?-->|.*)|<[!?][^>]*>?'
+                            rb'|<(script|style|textarea|title|xmp|iframe|noembed|noframes)\b(?:.*?</\1\s*>|.*)'
+                            rb'|<plaintext\b.*', re.IGNORECASE | re.DOTALL)
+
+# Markup that at least one of the extractors needs: headline selectors or newsletter markers
+_EXTRACTABLE_RE = re.compile(rb'<h1|headline|email|big-num', re.IGNORECASE)
+
+# Only the anchors are needed when a page is parsed for its links
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Markers of the WSJ email newsletter layouts (Logistics Report, etc.)
+NEWSLETTER_SELECTOR = ('.email-body__article, td[class*="email-body"], table[class*="email"], '
+                       'td[class*="big-num"]')
+
 
 class Config:
     """Global configuration for data handlers."""
@@ -61,6 +126,10 @@ class Config:
     _timeout = 10
     _max_workers = 10
     _backoff_factor = 2.0  # Backoff factor for retries
+    _backoff_jitter = 0.3  # Maximum random seconds added to each backoff
+    _rate_limit = 15  # Maximum requests per second across all threads
+    _cache_dir = None  # Directory for on-disk caches, disabled when None
+    _parse_workers = 0  # Processes for parsing article pages, 0 parses in the download threads
 
     def __new__(cls):
         if cls._instance is None:
@@ -71,37 +140,54 @@ class Config:
     def set_topics(cls, topics: List[str]):
         """Set the topics/subdomains of www.wsj.com to query."""
         cls._topics = topics
-        cls._instance = None  # Reset singleton to ensure new path is used
 
     @classmethod
     def set_exclude_patterns(cls, exclude_patterns: List[str]):
         """Set the patterns to exclude from article links."""
         cls._exclude_patterns = exclude_patterns
-        cls._instance = None
 
     @classmethod
     def set_max_retries(cls, max_retries: int):
         """Set the maximum number of retries for HTTP requests."""
         cls._max_retries = max_retries
-        cls._instance = None
 
     @classmethod
     def set_timeout(cls, timeout: int):
         """Set the timeout for HTTP requests."""
         cls._timeout = timeout
-        cls._instance = None
 
     @classmethod
     def set_max_workers(cls, max_workers: int):
         """Set the maximum number of worker threads for concurrent requests."""
         cls._max_workers = max_workers
-        cls._instance = None
 
     @classmethod
     def set_backoff_factor(cls, backoff_factor: float):
         """Set the backoff factor for retries."""
         cls._backoff_factor = backoff_factor
-        cls._instance = None
+
+    @classmethod
+    def set_backoff_jitter(cls, backoff_jitter: float):
+        """Set the maximum random jitter (in seconds) added to each retry backoff."""
+        cls._backoff_jitter = backoff_jitter
+
+    @classmethod
+    def set_rate_limit(cls, rate_limit: float):
+        """Set the maximum number of requests per second shared by all worker threads."""
+        if rate_limit <= 0:
+            raise ValueError(f"rate_limit must be positive, got {rate_limit}")
+        cls._rate_limit = rate_limit
+        _LIMITER.max_calls = rate_limit
+
+    @classmethod
+    def set_parse_workers(cls, parse_workers: int):
+        """Set the number of worker processes used to parse article pages (0 to parse in the download threads)."""
+        cls._parse_workers = parse_workers
+
+    @classmethod
+    def set_cache_dir(cls, cache_dir: Optional[str]):
+        """Set the directory used for on-disk caches, or None to disable caching."""
+        cls._cache_dir = cache_dir
 
     @classmethod
     def get_topics(cls) -> List[str]:
@@ -133,6 +219,26 @@ class Config:
         """Get the current backoff factor for retries."""
         return cls._backoff_factor
 
+    @classmethod
+    def get_backoff_jitter(cls) -> float:
+        """Get the current maximum jitter added to retry backoffs."""
+        return cls._backoff_jitter
+
+    @classmethod
+    def get_rate_limit(cls) -> float:
+        """Get the current maximum number of requests per second."""
+        return cls._rate_limit
+
+    @classmethod
+    def get_parse_workers(cls) -> int:
+        """Get the current number of parse worker processes."""
+        return cls._parse_workers
+
+    @classmethod
+    def get_cache_dir(cls) -> Optional[str]:
+        """Get the current cache directory (None when caching is disabled)."""
+        return cls._cache_dir
+
     @classmethod
     def reset_to_default(cls):
         """Reset to default root path (module directory)."""
@@ -142,9 +248,46 @@ class Config:
         cls._exclude_patterns = EXCLUDE_PATTERNS
         cls._max_workers = 10
         cls._backoff_factor = 2.0
+        cls._backoff_jitter = 0.3
+        cls._rate_limit = 15
+        _LIMITER.max_calls = cls._rate_limit
+        cls._cache_dir = None
+        cls._parse_workers = 0
         cls._instance = None
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing up to max_calls requests per period.
+    Callers only sleep when the bucket is empty, so bursts below the limit
+    go out immediately while the aggregate rate stays bounded.
+    """
+
+    __slots__ = ('max_calls', 'period', '_tokens', '_last', '_lock')
+
+    def __init__(self, max_calls: float, period: float = 1.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._tokens = float(max_calls)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available if the bucket is empty."""
+        with self._lock:
+            now = time.monotonic()
+            rate = self.max_calls / self.period
+            self._tokens = min(self.max_calls, self._tokens + (now - self._last) * rate)
+            self._last = now
+            # Reserve the token even when it has to be waited for, so that
+            # concurrent callers queue up behind each other
+            self._tokens -= 1
+            wait = -self._tokens / rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+_LIMITER = RateLimiter(max_calls=Config.get_rate_limit(), period=1.0)
 
 
 logger = _get_logger('WSJAdapter')
@@ -152,15 +295,15 @@ logger = _get_logger('WSJAdapter')
 
 def safe_get(url: str, session: requests.Session):
     """
-    GET with retries configured on the session,
-    plus a randomized sleep to throttle.
+    GET with retries and headers configured on the session (see create_session),
+    throttled by the shared rate limiter.
     Returns None if all retries fail.
     """
-    timeout = Config.get_timeout()
-    time.sleep(random.uniform(0.5, 1.5))  # Increased sleep for better etiquette
+    timeout = Config._timeout
+    _LIMITER.acquire()
     logger.debug(f"GET {url}")
     try:
-        resp = session.get(url, timeout=timeout, headers={"User-Agent": "Mozilla/5.0"})
+        resp = session.get(url, timeout=timeout)
         resp.raise_for_status()
         return resp
     except requests.RequestException as e:
@@ -168,25 +311,233 @@ def safe_get(url: str, session: requests.Session):
         return None
 
 
-def create_session() -> requests.Session:
+def cached_get(url: str, session: requests.Session, expire: float = WAYBACK_CACHE_EXPIRE):
+    """
+    safe_get backed by an on-disk cache of response bodies, enabled by
+    Config.set_cache_dir. Cached bodies younger than `expire` seconds are
+    returned without touching the network or the rate limiter, along with
+    the Content-Type header they were served with.
+    Returns None if the URL is not cached and all retries fail.
+    """
+    path = _cache_path(url)
+    if path is None:
+        return safe_get(url, session)
+
+    try:
+        if time.time() - path.stat().st_mtime < expire:
+            logger.debug(f"GET {url} (cached)")
+            resp = requests.Response()
+            resp._content = path.read_bytes()
+            # Entries of responses that had a Content-Type header start with it, as it
+            # decides the decoding and whether the page is HTML at all
+            if resp._content.startswith(_CACHE_HEADER):
+                header, resp._content = resp._content[len(_CACHE_HEADER):].split(b'\r\n\r\n', 1)
+                resp.headers['Content-Type'] = header.decode('latin-1')
+                resp.encoding = get_encoding_from_headers(resp.headers)
+            resp.status_code = 200
+            resp.url = url
+            return resp
+    except (OSError, ValueError):
+        pass
+
+    resp = safe_get(url, session)
+    if resp:
+        content_type = resp.headers.get('Content-Type')
+        header = _CACHE_HEADER + content_type.encode('latin-1', 'replace') + b'\r\n\r\n' if content_type else b''
+        try:
+            _write_atomic(path, header + resp.content)
+        except OSError as e:
+            logger.warning(f"Could not cache {url}: {e}")
+    return resp
+
+
+def _cache_path(url: str) -> Optional[Path]:
+    """Return the file caching the response for url, or None if caching is disabled."""
+    cache_dir = Config.get_cache_dir()
+    if cache_dir is None:
+        return None
+    return Path(cache_dir) / 'http' / hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def _drop_cached(url: str):
+    """Remove the cached response for url, e.g. after it turned out to be unusable."""
+    path = _cache_path(url)
+    if path is not None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _prune_cache(max_age: float = WAYBACK_CACHE_EXPIRE):
+    """
+    Delete the cached responses (and temporary files left behind by a crash)
+    older than max_age seconds, so that the cache does not grow without bound.
+    """
+    cache_dir = Config.get_cache_dir()
+    if cache_dir is None:
+        return
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        with os.scandir(Path(cache_dir) / 'http') as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError:
+                    pass
+    except OSError:
+        return
+    if removed:
+        logger.info(f"Removed {removed} expired entries from the cache")
+
+
+def _write_atomic(path: Path, data: bytes):
+    """
+    Write data to path through a per-thread temporary file, so that readers
+    (and later runs after a crash) never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+class _DNSCache:
+    """
+    Bounded TTL cache in front of socket.getaddrinfo for the given hosts.
+    Every new pooled connection to web.archive.org would otherwise repeat
+    the same DNS lookup; with the cache installed only the first one pays.
+    Lookups of any other host go straight to the resolver.
+    """
+
+    def __init__(self, hosts: Iterable[str], ttl: float = 300.0, maxsize: int = 32):
+        self.hosts = frozenset(hosts)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._resolve = socket.getaddrinfo
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def getaddrinfo(self, host, *args, **kwargs):
+        if host not in self.hosts:
+            return self._resolve(host, *args, **kwargs)
+        key = (host, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+        result = self._resolve(host, *args, **kwargs)
+        with self._lock:
+            # Evict expired entries first, then the least recently used ones
+            for expired in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                del self._entries[expired]
+            self._entries[key] = (now + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def install(self):
+        """Route socket.getaddrinfo (and therefore urllib3) through the cache."""
+        if socket.getaddrinfo != self.getaddrinfo:
+            socket.getaddrinfo = self.getaddrinfo
+
+
+_DNS_CACHE = _DNSCache(hosts=('web.archive.org',))
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets disable Nagle's algorithm and send TCP keep-alives."""
+
+    _socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self._socket_options)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(max_workers: Optional[int] = None) -> requests.Session:
     """
     Create a safe session for GET requests.
-    This session will be shared across threads to enable connection pooling.
+    This session will be shared across threads to enable connection pooling,
+    sized for max_workers threads (Config.get_max_workers() by default).
+    Lookups of the Wayback Machine host are cached for a few minutes;
+    other hosts resolved by the process are not affected.
     """
+    _DNS_CACHE.install()
     session = requests.Session()
-    # Increased total retries and backoff factor for more resilience
+    session.headers.update({"User-Agent": "Mozilla/5.0", "Connection": "keep-alive"})
+    # Increased total retries and backoff factor for more resilience.
+    # Retry-After is honoured on 429/503, so throttled requests wait
+    # exactly as long as the Wayback Machine asks.
     retries = Retry(
         total=Config.get_max_retries(),  # Reduced retries
         backoff_factor=Config.get_backoff_factor(),  # 1s, 2s, 4s, 8s, 16s
+        backoff_jitter=Config.get_backoff_jitter(),  # De-synchronise retries from concurrent workers
         status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"]
+        allowed_methods=["GET"],
+        respect_retry_after_header=True
+    )
+    # Size the pool above the worker count so that threads never block
+    # waiting for (or churn through) connections to the same host
+    if max_workers is None:
+        max_workers = Config.get_max_workers()
+    adapter = _KeepAliveAdapter(
+        max_retries=retries,
+        pool_connections=max(10, max_workers * 2),
+        pool_maxsize=max(10, max_workers * 4),
+        pool_block=False
     )
-    adapter = HTTPAdapter(max_retries=retries)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     return session
 
 
+def _parse_html(markup: Union[str, bytes], encoding: Optional[str] = None,
+                parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse markup with the tree builder resolved at import time."""
+    return BeautifulSoup(markup, builder=_HTML_BUILDER, from_encoding=encoding, parse_only=parse_only)
+
+
+def _make_soup(response: requests.Response, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse a response body into a BeautifulSoup object using HTML_PARSER (lxml when available).
+    The raw bytes are handed to the parser, which skips building response.text.
+    The header encoding is only used when the server actually declared a charset:
+    requests reports ISO-8859-1 for any text/html without one, and the page's own
+    <meta charset> is the better source in that case.
+    parse_only restricts the tree to the matching tags when only those are needed.
+    """
+    return _parse_html(response.content, _declared_encoding(response), parse_only)
+
+
+def _declared_encoding(response: requests.Response) -> Optional[str]:
+    """Return the encoding declared in the Content-Type header, or None if there is none."""
+    content_type = response.headers.get('Content-Type', '')
+    return response.encoding if 'charset=' in content_type.lower() else None
+
+
+def _extract_html_content(content: bytes, encoding: Optional[str]) -> List[Dict[str, str]]:
+    """
+    Parse a raw article page and extract its articles.
+    Takes plain bytes so that it can run in a worker process (see Config.set_parse_workers).
+    """
+    return extract_article_content(_parse_html(content, encoding))
+
+
+def _json_loads(data: bytes):
+    """Decode a JSON document from raw bytes, using orjson when it is installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def cdx_query(url: str, session: requests.Session, start_date: datetime.date, end_date: datetime.date) -> List[
     List[str]]:
     """
@@ -196,6 +547,7 @@ def cdx_query(url: str, session: requests.Session, start_date: datetime.date, en
     and returns a list of records containing timestamps and original URLs.
     The records are filtered to include only HTML pages with a status code of 200.
     The results are collapsed by digest to avoid duplicates.
+    When a cache directory is configured, responses are reused for a day.
     The function raises a WaybackMachineNoLinks exception if no records are found
     or if the request fails.
 
@@ -210,6 +562,12 @@ def cdx_query(url: str, session: requests.Session, start_date: datetime.date, en
     Raises:
         WaybackMachineNoLinks: If no records are found or if the request fails.
     """
+    return _cdx_records(url, session, start_date, end_date) or []
+
+
+def _cdx_records(url: str, session: requests.Session, start_date: datetime.date,
+                 end_date: datetime.date) -> Optional[List[List[str]]]:
+    """cdx_query, returning None instead of an empty list when the request fails."""
     cdx_url = (
         "https://web.archive.org/cdx/search/cdx"
         f"?url={url}?"
@@ -221,53 +579,101 @@ def cdx_query(url: str, session: requests.Session, start_date: datetime.date, en
         "&filter=statuscode:200"
         "&collapse=digest"
     )
-    resp = safe_get(cdx_url, session)
+    resp = cached_get(cdx_url, session, expire=CDX_CACHE_EXPIRE)
     if not resp:
         logger.error(f"Failed to fetch index for URL '{cdx_url}'")
-        return []
+        return None
 
-    records = resp.json()[1:]  # skip header row
+    try:
+        records = _json_loads(resp.content)[1:]  # skip header row
+    except (ValueError, TypeError, KeyError) as e:
+        # e.g. an HTML throttling page served with a 200; don't keep it around for a day
+        logger.error(f"Invalid index response for URL '{cdx_url}': {e}")
+        _drop_cached(cdx_url)
+        return None
     if not records:
         logger.warning(f"No records found for URL '{url}'")
     return records
 
 
+@lru_cache(maxsize=65536)  # Pages share most of their links; results are cached per process
 def is_article(url: str) -> bool:
     url = url.rsplit('https://', 1)[-1]
-    if not '-' in url:
-        return False
-    tail = url.rsplit('-', 1)[-1]
 
-    # Check if the URL ends with a valid article ID (at least 3 digits)
-    return len(re.compile(r'\d').findall(tail)) > 3
+    # Check if the URL ends with a valid article ID (at least 4 digits after the last '-')
+    return _ARTICLE_ID_RE.search(url) is not None
 
 
-def extract_article_links(soup: BeautifulSoup) -> List[str]:
+def _filter_article_links(hrefs: Iterable[str]) -> List[str]:
     """
-    Extract all article links from the BeautifulSoup object.
-    Focuses on finding actual article URLs, not navigation or other links.
+    Keep the hrefs that point at articles, dropping navigation, excluded
+    sections and other links, and strip the ?mod tracking parameter.
     """
-    article_links = []
-
-    # Find all links
-    links = soup.find_all('a', href=True)
-
-    for link in links:
-        href = link['href']
+    article_links = {}  # Insertion-ordered set, a page usually links to an article several times
+    exclude_patterns = tuple(Config._exclude_patterns)
 
-        # Skip if href is empty or just a fragment
-        if (not href or href.startswith('#') or
-                any([pattern in href.lower() for pattern in Config.get_exclude_patterns()]) or
-                not href.startswith('http')):
+    for href in hrefs:
+        # Skip if href is empty, just a fragment or relative, then scan the
+        # lower-cased href once for every exclude pattern
+        if not href or not href.startswith('http'):
+            continue
+        lowered = href.lower()
+        if any(pattern in lowered for pattern in exclude_patterns):
             continue
 
         href = href.rsplit('?mod', 1)[0]  # Remove query parameters if any
 
         # Check if it's an article URL
         if is_article(href):
-            article_links.append(href)
+            article_links[href] = None
+
+    return list(article_links)
 
-    return list(set(article_links))
+
+def extract_article_links(soup: Union[BeautifulSoup, str, bytes]) -> List[str]:
+    """
+    Extract all article links from the BeautifulSoup object.
+    Focuses on finding actual article URLs, not navigation or other links.
+    Raw HTML is also accepted, in which case only the anchors are parsed.
+    """
+    if not isinstance(soup, BeautifulSoup):
+        soup = _parse_html(soup, parse_only=_LINK_STRAINER)
+    return _filter_article_links(link['href'] for link in soup.find_all('a', href=True))
+
+
+def extract_article_links_fast(html: bytes) -> List[str]:
+    """
+    Extract all article links from the raw HTML of a page with a regex scan,
+    without building a DOM. Applies the same filtering as extract_article_links;
+    comments and raw-text elements (<script>, <style>, <textarea>, ...) are cut
+    out first so that, like the parser, the scan ignores anchors inside them.
+    Results match the parsed extraction on well-formed pages; badly malformed
+    markup (e.g. attributes not separated by whitespace) can still differ.
+    """
+    return _filter_article_links(unescape(match.group(match.lastindex).decode('utf-8', 'replace'))
+                                 for match in _HREF_RE.finditer(_NON_MARKUP_RE.sub(b'', html)))
+
+
+def _response_article_links(response: requests.Response) -> List[str]:
+    """
+    Extract the article links of a fetched page, scanning the raw HTML first
+    and only parsing it when the scan finds nothing.
+    """
+    links = extract_article_links_fast(response.content)
+    if not links:
+        links = extract_article_links(_make_soup(response, parse_only=_LINK_STRAINER))
+    return links
+
+
+def _meta_contents(soup: BeautifulSoup) -> Dict[str, str]:
+    """
+    Map each <meta name=...> to the content of its first tag, collected in a
+    single pass over the document instead of one search per name.
+    """
+    contents = {}
+    for meta in soup.find_all('meta', attrs={'name': True}):
+        contents.setdefault(meta['name'], meta.get('content'))
+    return contents
 
 
 def extract_single_article_content(soup: BeautifulSoup) -> Dict[str, str]:
@@ -304,28 +710,25 @@ def extract_single_article_content(soup: BeautifulSoup) -> Dict[str, str]:
     keyword_selectors = ['cXenseParse:wsj-editorial-keyword',
                          'page_editorial_keywords',
                          'keywords']
+    meta_contents = _meta_contents(soup)
     for selector in keyword_selectors:
-        keyword_elem = soup.find('meta', attrs={'name': selector})
-        if keyword_elem and keyword_elem.get('content'):
-            article_data['keywords'] = keyword_elem.get('content')
+        if meta_contents.get(selector):
+            article_data['keywords'] = meta_contents[selector]
             break
 
     summary_selectors = ['description',
                          'cXenseParse:recs:wsj-summary']
     # Extract description
     for selector in summary_selectors:
-        summary_elem = soup.find('meta', attrs={'name': selector})
-        if summary_elem and summary_elem.get('content'):
-            article_data['summary'] = summary_elem.get('content')
+        if meta_contents.get(selector):
+            article_data['summary'] = meta_contents[selector]
             break
 
     date_selectors = ['cXenseParse:recs:wsj-date',
                       'article.published']
     for selector in date_selectors:
-        date_elem = soup.find('meta', attrs={'name': selector})
-        if date_elem and date_elem.get('content'):
-            date = date_elem.get('content')
-            date = re.compile(r'\d{4}-\d{2}-\d{2}').findall(date)
+        if meta_contents.get(selector):
+            date = re.compile(r'\d{4}-\d{2}-\d{2}').findall(meta_contents[selector])
             if date:
                 article_data['date'] = date[0]
                 break
@@ -430,6 +833,14 @@ def extract_single_article_content(soup: BeautifulSoup) -> Dict[str, str]:
     return article_data
 
 
+def _is_newsletter(soup: BeautifulSoup) -> bool:
+    """
+    Check whether the page uses one of the WSJ email newsletter layouts.
+    A single combined CSS selector keeps this to one walk of the DOM.
+    """
+    return soup.select_one(NEWSLETTER_SELECTOR) is not None
+
+
 def extract_newsletter_content(soup: BeautifulSoup) -> List[Dict[str, str]]:
     """
     Extract content from WSJ email newsletter formats that contain multiple articles.
@@ -438,26 +849,7 @@ def extract_newsletter_content(soup: BeautifulSoup) -> List[Dict[str, str]]:
     """
     articles = []
 
-    # Check if this looks like an email newsletter format
-    email_body_selectors = [
-        '.email-body__article',
-        'td[class*="email-body"]',
-        'table[class*="email"]',
-        'td.email-body__article',
-        'td[class*="big-num"]'
-    ]
-
-    is_email_newsletter = False
-    for selector in email_body_selectors:
-        if soup.select(selector):
-            is_email_newsletter = True
-            break
-
-    # Also check for h1 elements which are common in newsletters
-    if not is_email_newsletter and soup.find_all('h1'):
-        is_email_newsletter = True
-
-    if not is_email_newsletter:
+    if not _is_newsletter(soup):
         # Fall back to single article extraction
         single_article = extract_single_article_content(soup)
         if single_article['headline'] and single_article['content']:
@@ -640,19 +1032,20 @@ def extract_newsletter_content(soup: BeautifulSoup) -> List[Dict[str, str]]:
 
 def extract_article_content(soup: BeautifulSoup) -> List[Dict[str, str]]:
     """
-    Intelligently extract article content from WSJ pages.
-    Tries both single article and newsletter extraction methods,
-    then selects the best result based on content quality and length.
+    Extract article content from WSJ pages.
+    Pages without any newsletter markers only go through the single article
+    extractor. Pages with them (which includes ordinary articles embedding an
+    email sign-up widget) are run through both extractors and the result with
+    the higher content quality is kept.
     Returns a list of article dictionaries.
     """
-    # Try both extraction methods
-    newsletter_articles = extract_newsletter_content(soup)
     single_article = extract_single_article_content(soup)
+    single_article_list = [single_article] if single_article['headline'] and single_article['content'] else []
+    if not _is_newsletter(soup):
+        logger.debug("Selected single article extraction method")
+        return single_article_list
 
-    # Convert single article to list format for comparison
-    single_article_list = [single_article] if single_article.get('headline') and single_article.get('content') else []
-
-    # Calculate quality scores for each method
+    newsletter_articles = extract_newsletter_content(soup)
     newsletter_score = _calculate_content_quality(newsletter_articles)
     single_article_score = _calculate_content_quality(single_article_list)
 
@@ -662,9 +1055,8 @@ def extract_article_content(soup: BeautifulSoup) -> List[Dict[str, str]]:
     if newsletter_score > single_article_score:
         logger.debug("Selected newsletter extraction method")
         return newsletter_articles
-    else:
-        logger.debug("Selected single article extraction method")
-        return single_article_list
+    logger.debug("Selected single article extraction method")
+    return single_article_list
 
 
 def _calculate_content_quality(articles: List[Dict[str, str]]) -> float:
@@ -678,43 +1070,38 @@ def _calculate_content_quality(articles: List[Dict[str, str]]) -> float:
     total_score = 0.0
 
     for article in articles:
-        headline = article.get('headline', '')
-        content = article.get('content', '')
-        summary = article.get('summary', '')
+        get = article.get
+        content_length = len(get('content', ''))
 
         # Base score from content length (longer content is generally better)
-        content_score = len(content) * 0.1
-
-        # Bonus for having a headline
-        headline_bonus = 50 if headline else 0
-
-        # Bonus for having a summary
-        summary_bonus = 25 if summary else 0
+        content_score = content_length * 0.1
 
         # Penalty for very short content (likely not a real article)
-        if len(content) < 100:
+        if content_length < 100:
             content_score *= 0.5
 
-        # Bonus for having keywords or companies (indicates structured content)
-        keywords_bonus = 25 if article.get('keywords') else 0
-        companies_bonus = 25 if article.get('companies') else 0
-
-        # Bonus for having a date
-        date_bonus = 25 if article.get('date') else 0
-
-        article_score = content_score + headline_bonus + summary_bonus + keywords_bonus + companies_bonus + date_bonus
-        total_score += article_score
+        # Bonuses for having a headline and a summary, for keywords or companies
+        # (indicates structured content) and for having a date
+        total_score += (content_score +
+                        (50 if get('headline') else 0) +
+                        (25 if get('summary') else 0) +
+                        (25 if get('keywords') else 0) +
+                        (25 if get('companies') else 0) +
+                        (25 if get('date') else 0))
 
     # Average score per article
-    return total_score / len(articles) if articles else 0.0
+    return total_score / len(articles)
 
 
-def process_article_url(url: Union[list, str], session: requests.Session) -> Optional[List[Dict]]:
+def process_article_url(url: Union[list, str], session: requests.Session,
+                        parse_executor: Optional[Executor] = None) -> Optional[List[Dict]]:
     """
     Process a single article URL or a list of URLs for the same article,
     to extract its content.
     Returns a list of article data if successful, None otherwise.
     Handles both single articles and newsletter formats with multiple articles.
+    When a parse_executor is given, parsing and extraction run on it
+    while the calling thread only does the network I/O.
     """
     if not isinstance(url, list):
         url = [url]
@@ -722,14 +1109,23 @@ def process_article_url(url: Union[list, str], session: requests.Session) -> Opt
 
     for url in urls:
         try:
-            response = safe_get(url, session)
+            response = cached_get(url, session)
             if not response:
                 continue
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            # Skip non-HTML responses and pages without any headline or newsletter
+            # markup before paying for a full parse
+            if ('html' not in response.headers.get('Content-Type', 'text/html') or
+                    not _EXTRACTABLE_RE.search(response.content)):
+                logger.debug(f"No extractable content at {url}")
+                continue
 
             # Use the unified extraction function
-            articles = extract_article_content(soup)
+            if parse_executor is not None:
+                articles = parse_executor.submit(_extract_html_content, response.content,
+                                                 _declared_encoding(response)).result()
+            else:
+                articles = extract_article_content(_make_soup(response))
 
             if articles:
                 # Add URL and timestamp to each article
@@ -754,13 +1150,12 @@ def process_cdx_record(record: List[str], shared_session: requests.Session) -> O
     url = f'https://web.archive.org/web/{timestamp}/{website}'
     logger.info(f"Processing record: {url}")
 
-    response = safe_get(url, shared_session)
+    response = cached_get(url, shared_session)
     if not response:
         logger.error(f"Failed to fetch main archived page at {url}")
         return None
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    article_links = extract_article_links(soup)
+    article_links = _response_article_links(response)
 
     if not article_links:
         logger.warning(f"No article links found in the archived page at {url}")
@@ -782,44 +1177,57 @@ def process_cdx_record(record: List[str], shared_session: requests.Session) -> O
 
 
 class WSJScrapper:
-    def __init__(self, start_date: datetime.date, end_date: datetime.date, no_of_captures: int = 10):
+    def __init__(self, start_date: datetime.date, end_date: datetime.date, no_of_captures: int = 10,
+                 max_workers: Optional[int] = None):
         self.url = 'www.wsj.com'
         self.start_date = start_date
         self.end_date = end_date
         self.no_of_captures = no_of_captures
-        self.session = create_session()
+        # Number of requests in flight at once; defaults to Config.get_max_workers()
+        self.max_workers = max_workers if max_workers is not None else Config.get_max_workers()
+        self.session = create_session(max_workers=self.max_workers)
         self.records = None
         self.article_links = []
+        # Topics and captures that could not be fetched by the last get_all_records /
+        # get_all_article_links call; results are only checkpointed when these are empty
+        self.failed_topics = []
+        self.failed_records = []
 
     def get_all_records(self) -> List[List[str]]:
-        def random_choice(df):
-            """
-            Randomly select a specified number of captures from each group.
-            If no captures are available, return an empty DataFrame.
-            """
-            if len(df) == 0:
-                return pd.DataFrame(columns=df.columns)
-            return df.sample(n=min(self.no_of_captures, len(df)), replace=False, random_state=42)
-
-        logger.info(f'Retrieving records from:\n{"\n".join([f"www.wsj.com{topic}" for topic in Config.get_topics()])}\n')
-        records = []
-        for topic in Config.get_topics():
-            records.extend(cdx_query(url=f'www.wsj.com{topic}', session=self.session, start_date=self.start_date,
-                                     end_date=self.end_date))
+        topics = Config.get_topics()
+        topic_urls = '\n'.join(f'www.wsj.com{topic}' for topic in topics)
+        logger.info(f'Retrieving records from:\n{topic_urls}\n')
+        # The CDX queries are independent round-trips, so issue them concurrently
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(_cdx_records, url=f'www.wsj.com{topic}', session=self.session,
+                                       start_date=self.start_date, end_date=self.end_date): topic
+                       for topic in topics}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        self.failed_topics = [topic for topic in topics if results[topic] is None]
+        # Concatenate in topic order so that the capture sampling below is deterministic
+        records = [record for topic in topics for record in results[topic] or []]
 
         if self.no_of_captures > -1:
             df = pd.DataFrame(records, columns=['timestamp', 'original'])
             df['datetime'] = pd.to_datetime(df['timestamp'], format='%Y%m%d%H%M%S')
             df['date'] = df['datetime'].dt.date
-            df = df.sort_values(by='datetime')
-            df['clean_url'] = df.original.apply(lambda x: '/'.join(
-                [i.strip() for i in x.replace('http://', '').replace('https://', '').split('/') if i.strip()]))
-            df = (df.groupby(['date', 'clean_url'], as_index=False).apply(random_choice, include_groups=False).
-                  reset_index(drop=True))
-            records = df[['timestamp', 'original']].values.tolist()
+            df['clean_url'] = (df['original'].str.replace(r'^https?://', '', regex=True)
+                               .str.replace(r'/+', '/', regex=True)
+                               .str.strip('/'))
+            # Group on integer category codes rather than hashing Python objects per row
+            df['date'] = df['date'].astype('category')
+            df['clean_url'] = df['clean_url'].astype('category')
+            # Randomly sample up to no_of_captures captures per day and page: shuffle within
+            # each group using a seeded random key, then keep the first rows of every group
+            df['_r'] = np.random.default_rng(42).random(len(df))
+            df = df.sort_values(['date', 'clean_url', '_r'])
+            df = df.groupby(['date', 'clean_url'], observed=True, sort=False).head(self.no_of_captures)
+            records = list(map(list, zip(df['timestamp'].to_numpy(), df['original'].to_numpy())))
         return records
 
-    def get_all_article_links(self, records: List[List[str]]) -> List[str]:
+    def get_all_article_links(self, records: List[List[str]]) -> List[List[str]]:
         """
         Fetch all article links from the Wayback Machine for the specified URL and date range.
         This method retrieves CDX records and processes each record to extract article links.
@@ -829,64 +1237,191 @@ class WSJScrapper:
             timestamp, website = record
 
             archive_url = f'https://web.archive.org/web/{timestamp}/{website}'
-            response = safe_get(archive_url, self.session)
+            response = cached_get(archive_url, self.session)
             if not response:
                 return None
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            links = list(set(extract_article_links(soup)))
-            return links
+            return _response_article_links(response)
 
         logger.info(f"Fetching all article links between {self.start_date} and {self.end_date}")
 
-        all_links = []
-
-        with ThreadPoolExecutor(max_workers=Config.get_max_workers()) as executor:
-            futures = [executor.submit(_do_get_article_links, record) for record in records]
-
-            for future in futures:
-                result = future.result()
-                if result:
-                    all_links.extend(result)
-
-        df = pd.DataFrame(all_links, columns=['url'])
-        df['date'] = pd.to_datetime(df['url'].str.extract(r'(\d{8})')[0], format='%Y%m%d')
-        df['article_url'] = df.url.apply(lambda x: x.rsplit('https://', 1)[-1])
-        pre = len(df.article_url.unique())
-        df = df[~df.article_url.isin(self.article_links)]
-        logger.info(f'Filtered out {pre - len(df.article_url.unique())} previously processed articles')
-        df = df.groupby(['article_url']).url.apply(lambda x: x.tolist()).reset_index()
-        self.article_links.extend(list(set(df['article_url'].tolist())))
-        all_links = df['url'].tolist()
+        # Group the archived copies of each article by its original URL as the results come in
+        archive_urls: Dict[str, List[str]] = {}
+
+        self.failed_records = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(_do_get_article_links, record): record for record in records}
+
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching article links: {e}")
+                    result = None
+                if result is None:
+                    self.failed_records.append(futures[future])
+                elif result:
+                    for url in result:
+                        archive_urls.setdefault(url.rsplit('https://', 1)[-1], []).append(url)
+
+        all_links = self._filter_processed(archive_urls)
         logger.info(f"Found {len(all_links)} distinct article links from between {self.start_date} and {self.end_date}")
         return all_links
 
-    def download(self) -> List[Dict]:
+    def _filter_processed(self, archive_urls: Dict[str, List[str]]) -> List[List[str]]:
+        """
+        Drop the articles already processed by this instance and mark the rest as processed.
+        archive_urls maps each article URL to the archived copies of it.
+        """
+        processed = set(self.article_links)
+        new_links = {article_url: urls for article_url, urls in archive_urls.items() if article_url not in processed}
+        logger.info(f'Filtered out {len(archive_urls) - len(new_links)} previously processed articles')
+        self.article_links.extend(new_links)
+        return list(new_links.values())
+
+    def _checkpoint_path(self, name: str) -> Optional[Path]:
+        cache_dir = Config.get_cache_dir()
+        if cache_dir is None:
+            return None
+        # Key on everything that changes the records or links, so that a run with
+        # other settings never picks up stale results
+        settings = json.dumps([Config.get_topics(), Config.get_exclude_patterns(), self.no_of_captures])
+        key = hashlib.sha1(settings.encode('utf-8')).hexdigest()[:10]
+        return Path(cache_dir) / f'{name}_{self.start_date:%Y%m%d}_{self.end_date:%Y%m%d}_{key}.json'
+
+    def _load_checkpoint(self, name: str) -> Optional[list]:
+        path = self._checkpoint_path(name)
+        if path is None:
+            return None
+        try:
+            # Checkpoints are derived from the CDX index, so they go stale as fast as it does
+            if time.time() - path.stat().st_mtime >= CDX_CACHE_EXPIRE:
+                logger.info(f"Ignoring expired checkpoint {path}")
+                return None
+            logger.info(f"Loading {name} from checkpoint {path}")
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except OSError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+    def _save_checkpoint(self, name: str, data: list):
+        path = self._checkpoint_path(name)
+        if path is None:
+            return
+        try:
+            _write_atomic(path, json.dumps(data).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not save checkpoint {path}: {e}")
+
+    def _collect_article_links(self) -> List[List[str]]:
+        """
+        Retrieve the CDX records and the article links found in them.
+        When a cache directory is configured (Config.set_cache_dir), both are
+        checkpointed per date range and settings (topics, exclude patterns and
+        number of captures) so that a re-run after a failed download goes
+        straight to fetching articles. A phase is only checkpointed when it
+        returned results and none of its topics or captures failed to download,
+        so that a re-run retries it instead of reusing incomplete results.
+        Like the cached CDX queries, checkpoints are only reused for a day.
+        """
         logger.info(f"Starting download for {self.url} from {self.start_date} to {self.end_date}")
-        records = self.get_all_records()
+        _prune_cache()
+        records = self._load_checkpoint('records')
+        if records is None:
+            records = self.get_all_records()
+            if self.failed_topics:
+                logger.warning(f"Not checkpointing records: {len(self.failed_topics)} topics failed")
+            elif records:
+                self._save_checkpoint('records', records)
         self.records = records
 
         logger.info(f"Retrieved {len(records)} CDX records")
-        article_links = self.get_all_article_links(records)
+        article_links = self._load_checkpoint('article_links')
+        if article_links is None:
+            article_links = self.get_all_article_links(records)
+            if self.failed_topics or self.failed_records:
+                logger.warning(f"Not checkpointing article links: {len(self.failed_topics)} topics and "
+                               f"{len(self.failed_records)} captures failed")
+            elif article_links:
+                self._save_checkpoint('article_links', article_links)
+        else:
+            article_links = self._filter_processed({urls[0].rsplit('https://', 1)[-1]: urls
+                                                    for urls in article_links})
+        return article_links
+
+    def _iter_articles(self, article_links: List[List[str]]) -> Iterator[List[Dict]]:
+        """
+        Process the article links concurrently, yielding the extracted articles
+        of each link as soon as they are available, in completion order.
+        """
+        parse_workers = Config.get_parse_workers()
+        # Spawn rather than fork: the parent already runs the network threads
+        parse_executor = (ProcessPoolExecutor(max_workers=parse_workers, mp_context=get_context('spawn'))
+                          if parse_workers > 0 else None)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(process_article_url, link_list, self.session, parse_executor)
+                           for link_list in article_links]
+
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Error processing article: {e}")
+                        continue
+                    if result:
+                        yield result
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
+
+    def download(self) -> List[Dict]:
+        article_links = self._collect_article_links()
 
         if not article_links:
             logger.error(f"Could not retrieve any article links")
             return []
 
         all_articles = []
-
-        with ThreadPoolExecutor(max_workers=Config.get_max_workers()) as executor:
-            futures = [executor.submit(process_article_url, link_list, self.session) for link_list in article_links]
-
-            for future in futures:
-                result = future.result()
-                if result:
-                    # result is now a list, so extend instead of append
-                    all_articles.extend(result)
+        for result in self._iter_articles(article_links):
+            # result is now a list, so extend instead of append
+            all_articles.extend(result)
         logger.info(f"Successfully extracted {len(all_articles)} articles")
         logger.info(f"Finished processing. Total articles extracted: {len(all_articles)}")
         return all_articles
 
+    def download_to_parquet(self, path: str) -> int:
+        """
+        Download the articles and stream them to a Parquet file at `path` as they
+        are extracted, instead of holding every article in memory.
+        Requires pyarrow (pip install wsj-scrapper[parquet]).
+        Returns the number of articles written.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("download_to_parquet requires pyarrow: pip install wsj-scrapper[parquet]") from e
+
+        article_links = self._collect_article_links()
+
+        if not article_links:
+            logger.error("Could not retrieve any article links")
+            return 0
+
+        schema = pa.schema([(field, pa.large_string() if field == 'content' else pa.string())
+                            for field in ARTICLE_FIELDS])
+        count = 0
+        with pq.ParquetWriter(path, schema, compression='zstd') as writer:
+            for result in self._iter_articles(article_links):
+                writer.write_batch(pa.RecordBatch.from_pylist(result, schema=schema))
+                count += len(result)
+        logger.info(f"Finished processing. Total articles written to {path}: {count}")
+        return count
+
 
 if __name__ == "__main__":
     # Test with a smaller date range and fewer workers
@@ -917,6 +1452,10 @@ if __name__ == "__main__":
 
     # Save to JSON file
     if downloaded_articles:
-        with open('extracted_articles_new.json', 'w', encoding='utf-8') as f:
-            json.dump(downloaded_articles, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open('extracted_articles_new.json', 'wb') as f:
+                f.write(orjson.dumps(downloaded_articles, option=orjson.OPT_INDENT_2))
+        else:
+            with open('extracted_articles_new.json', 'w', encoding='utf-8') as f:
+                json.dump(downloaded_articles, f, indent=2, ensure_ascii=False)
         print(f"\nArticles saved to extracted_articles.json")
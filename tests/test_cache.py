@@ -0,0 +1,106 @@
+import datetime
+import hashlib
+import os
+from typing import Optional
+from unittest import mock
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from wsj_scrapper.wsj_scrapper import Config, cached_get, _cdx_records, _make_soup, _prune_cache
+
+URL = 'https://web.archive.org/web/20240101000000/https://www.wsj.com/business/naive-story-12345678'
+
+
+def _response(body: bytes, content_type: Optional[str]) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.url = URL
+    resp.headers = CaseInsensitiveDict({'Content-Type': content_type} if content_type is not None else {})
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    resp._content = body
+    return resp
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    Config.set_cache_dir(str(tmp_path))
+    yield tmp_path
+    Config.reset_to_default()
+
+
+def test_second_call_is_served_from_cache(cache_dir):
+    session = mock.Mock(spec=requests.Session)
+    session.get.return_value = _response(b'<p>cached</p>', 'text/html')
+
+    first = cached_get(URL, session)
+    second = cached_get(URL, session)
+
+    session.get.assert_called_once()
+    assert second.content == first.content == b'<p>cached</p>'
+    assert second.status_code == 200
+
+
+def test_cache_hit_preserves_header_encoding(cache_dir):
+    session = mock.Mock(spec=requests.Session)
+    session.get.return_value = _response('<p>naïve</p>'.encode('cp1252'), 'text/html; charset=windows-1252')
+
+    fresh = cached_get(URL, session)
+    cached = cached_get(URL, session)
+
+    session.get.assert_called_once()
+    assert cached.headers['Content-Type'] == 'text/html; charset=windows-1252'
+    assert _make_soup(cached).p.text == _make_soup(fresh).p.text == 'naïve'
+
+
+def test_cache_hit_without_content_type_matches_original(cache_dir):
+    session = mock.Mock(spec=requests.Session)
+    session.get.return_value = _response(b'<p>plain</p>', None)
+
+    fresh = cached_get(URL, session)
+    cached = cached_get(URL, session)
+
+    session.get.assert_called_once()
+    assert 'Content-Type' not in cached.headers
+    assert cached.content == fresh.content == b'<p>plain</p>'
+
+
+def test_cache_write_failure_still_returns_response(tmp_path):
+    # A file where the cache directory should be makes every write fail
+    blocker = tmp_path / 'cache'
+    blocker.write_text('')
+    Config.set_cache_dir(str(blocker))
+    try:
+        session = mock.Mock(spec=requests.Session)
+        session.get.return_value = _response(b'<p>body</p>', 'text/html')
+        assert cached_get(URL, session).content == b'<p>body</p>'
+    finally:
+        Config.reset_to_default()
+
+
+def test_invalid_cdx_response_is_not_cached(cache_dir):
+    session = mock.Mock(spec=requests.Session)
+    session.get.return_value = _response(b'<html>Too many requests</html>', 'text/html')
+    start, end = datetime.date(2024, 1, 1), datetime.date(2024, 1, 2)
+
+    assert _cdx_records('www.wsj.com', session, start, end) is None
+    assert _cdx_records('www.wsj.com', session, start, end) is None
+
+    assert session.get.call_count == 2
+    assert not any((cache_dir / 'http').iterdir())
+
+
+def test_prune_cache_removes_only_expired_entries(cache_dir):
+    session = mock.Mock(spec=requests.Session)
+    session.get.return_value = _response(b'<p>body</p>', 'text/html')
+    cached_get(URL, session)
+    cached_get(URL + '-old', session)
+    fresh, old = (cache_dir / 'http' / hashlib.sha1(url.encode('utf-8')).hexdigest() for url in (URL, URL + '-old'))
+    os.utime(old, (0, 0))
+
+    _prune_cache()
+
+    assert fresh.exists()
+    assert not old.exists()
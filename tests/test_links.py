@@ -0,0 +1,66 @@
+import random
+import re
+import string
+import time
+
+import pytest
+
+from wsj_scrapper.wsj_scrapper import extract_article_links, extract_article_links_fast, is_article
+
+
+def _anchor(name: str) -> str:
+    return f'<a href="https://www.wsj.com/business/{name}-12345678">{name}</a>'
+
+
+PAGES = [
+    '<html><head><script src="x.js"></script></head><body>' + _anchor('plain') + '</body></html>',
+    '<a class=card href=https://www.wsj.com/business/unquoted-12345678>x</a>',
+    "<a hreflang='en' href = 'https://www.wsj.com/business/single-12345678'>x</a>",
+    '<A HREF="https://www.wsj.com/business/upper-12345678">x</A>',
+    '<a data-href="https://www.wsj.com/business/data-12345678" href="https://www.wsj.com/business/real-12345678">',
+    '<a href="https://www.wsj.com/business/entity-12345678?a=1&amp;b=2">x</a>',
+    '<a title=">" href="https://www.wsj.com/business/gt-12345678">x</a>',
+    '<a title="a<b" href="https://www.wsj.com/business/lt-12345678">x</a>',
+    '<a href="https://www.wsj.com/business/first-12345678" href="https://www.wsj.com/business/second-12345678">x</a>',
+    '<a/href="https://www.wsj.com/business/slash-12345678">x</a>',
+    '<!-- ' + _anchor('comment') + ' -->' + _anchor('after'),
+    '<!-->' + _anchor('empty-comment'),
+    '<script>document.write(\'' + _anchor('script') + '\')</script>' + _anchor('after'),
+    '<textarea>' + _anchor('textarea') + '</textarea>' + _anchor('after'),
+    '<style>' + _anchor('style') + '</style>' + _anchor('after'),
+    '<title>' + _anchor('title') + '</title>' + _anchor('after'),
+    '<noscript>' + _anchor('noscript') + '</noscript>',
+    '<svg><title>icon</title></svg>' + _anchor('svg'),
+    _anchor('before') + '<!-- ' + _anchor('unclosed-comment'),
+    _anchor('before') + '<script>' + _anchor('unclosed-script'),
+    _anchor('before') + '<textarea>' + _anchor('unclosed-textarea'),
+]
+
+
+@pytest.mark.parametrize('html', PAGES)
+def test_fast_link_scan_matches_parser(html):
+    assert extract_article_links_fast(html.encode()) == extract_article_links(html.encode())
+
+
+@pytest.mark.parametrize('junk', [b'<a title="x" ', b'<script ', b'<!-- ', b'<a '])
+def test_fast_link_scan_is_linear_on_unclosed_tags(junk):
+    html = junk * (100_000 // len(junk))
+    start = time.perf_counter()
+    extract_article_links_fast(html)
+    assert time.perf_counter() - start < 1.0
+
+
+def _tail_digit_rule(url: str) -> bool:
+    # is_article as originally written: more than 3 digits after the last '-'
+    url = url.rsplit('https://', 1)[-1]
+    if '-' not in url:
+        return False
+    return len(re.findall(r'\d', url.rsplit('-', 1)[-1])) > 3
+
+
+def test_is_article_matches_tail_digit_rule():
+    rng = random.Random(0)
+    alphabet = string.ascii_lowercase + string.digits * 3 + '-/'
+    for _ in range(20000):
+        url = 'https://www.wsj.com/' + ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert is_article(url) == _tail_digit_rule(url), url